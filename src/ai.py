@@ -1,17 +1,20 @@
 import json
 import logging
-import tempfile
+import queue
+import threading
+from io import BytesIO
 from pathlib import Path
-from typing import Optional  # BinaryIO, cast
+from typing import Optional, Union  # BinaryIO, cast
 
 import pypdfium2 as pdfium
 
 # from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
-from docling.datamodel.base_models import InputFormat
+from docling.datamodel.base_models import DocumentStream, InputFormat
 from docling.datamodel.document import ConversionResult
 from docling.datamodel.pipeline_options import PdfPipelineOptions
 from docling.datamodel.settings import settings
 from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling.utils.locks import pypdfium2_lock
 from docling_core.types.doc import (
     # BoundingBox,
     # CoordOrigin,
@@ -37,7 +40,7 @@ from tqdm import tqdm
 # )
 # from cell_processor import CellProcessor
 # from exceptions import PdfixFailedToOpenException, PdfixFailedToRenderException, PdfixInitializeException
-from constants import PERCENT_AI, PERCENT_CONVERT, PERCENT_RENDER, ZOOM
+from constants import PERCENT_AI, PERCENT_CONVERT, PERCENT_RENDER, RENDER_QUEUE_SIZE, ZOOM
 from internal_classes import InternalDocument, InternalElement, InternalPage
 from logger import get_logger
 from utils import disable_additional_logging
@@ -116,21 +119,7 @@ class DoclingWrapper:
 
         # Run docling
         try:
-            pipeline_options: PdfPipelineOptions = PdfPipelineOptions()
-            pipeline_options.do_ocr = True
-            pipeline_options.do_table_structure = True
-
-            pipeline_options.do_formula_enrichment = self.do_formula_recognition
-            pipeline_options.do_picture_description = self.do_image_description
-            pipeline_options.artifacts_path = settings.cache_dir.joinpath("models")
-
-            if self.do_image_description:
-                # Overwrite default 0.05 value for 5% of the page area
-                pipeline_options.picture_description_options.picture_area_threshold = 0.0
-
-            converter: DocumentConverter = DocumentConverter(
-                format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
-            )
+            converter: DocumentConverter = self._create_converter(InputFormat.PDF)
             result: ConversionResult = converter.convert(self.path)
 
             self.progress_bar.update(docling_step_units)
@@ -168,14 +157,15 @@ class DoclingWrapper:
 
             self.progress_bar.update(bar_step)
 
+        items: dict[str, NodeItem] = self._create_item_index(document)
         for reference in document.body.children:
             # Get the item for the reference
-            item: Optional[NodeItem] = self._get_item(document, reference.cref)
+            item: Optional[NodeItem] = items.get(reference.cref)
             if item is None:
                 continue
 
             # Get first page that element appears in
-            elements: list[InternalElement] = self._create_elements(document, item, None)
+            elements: list[InternalElement] = self._create_elements(items, item, None)
             for element in elements:
                 page_index: int = element.page_number - 1
 
@@ -209,6 +199,12 @@ class DoclingWrapper:
         pdf: pdfium.PdfDocument = pdfium.PdfDocument(str(self.path))
         pages_count: int = len(pdf)
 
+        if pages_count == 0:
+            # Nothing to process, skip loading models and rendering
+            pdf.close()
+            self.progress_bar.update(self.progress_units_total)
+            return InternalDocument()
+
         render_step_units: float = self.progress_units_total * PERCENT_RENDER
         docling_step_units: float = self.progress_units_total * PERCENT_AI
         convert_step_units: float = self.progress_units_total * PERCENT_CONVERT
@@ -216,52 +212,43 @@ class DoclingWrapper:
         docling_step: float = docling_step_units / pages_count
         convert_step: float = convert_step_units / pages_count
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_folder: Path = Path(temp_dir).resolve()
-            outputs_folder: Path = Path(temp_dir).joinpath("outputs")
-            outputs_folder.mkdir(exist_ok=True)
-
-            # Render PDF pages into images
-            for page_index in range(pages_count):
-                self.progress_bar.set_description(f"Rendering page {page_index + 1}/{pages_count}")
-                page_number: int = page_index + 1
-                suffix: str = f"-page-{page_number}"
-                image_filename: str = f"{self.path.stem}{suffix}.png"
-                image_path: Path = temp_folder.joinpath(image_filename)
+        internal_document: InternalDocument = InternalDocument()
 
-                page: pdfium.PdfPage = pdf.get_page(page_index)
-                page_bitmap: pdfium.PdfBitmap = page.render(scale=ZOOM)
-                page_image: Image.Image = page_bitmap.to_pil()
-                page_image.save(image_path, format="PNG")
+        # One converter for all pages, so Docling loads its models only once and reuses them for each page
+        converter: DocumentConverter = self._create_converter(InputFormat.IMAGE)
 
-                self.progress_bar.update(rendering_step)
+        # Render PDF pages into images in separate thread so next pages are ready while docling processes current
+        rendered_pages: queue.Queue[Union[DocumentStream, Exception]] = queue.Queue(maxsize=RENDER_QUEUE_SIZE)
+        stop_rendering: threading.Event = threading.Event()
+        render_thread: threading.Thread = threading.Thread(
+            target=self._render_pages, args=(pdf, rendered_pages, stop_rendering)
+        )
+        render_thread.start()
 
-            internal_document: InternalDocument = InternalDocument()
+        try:
+            # Load AI models before first page (while first pages are rendered) so each page takes similar time
+            try:
+                self.progress_bar.set_description("Loading AI models")
+                converter.initialize_pipeline(InputFormat.IMAGE)
+            except Exception as e:
+                logger.error("Error during docling initialization:")
+                logger.exception(e)
+                return None
 
             # Run docling and convert data
             for page_index in range(pages_count):
                 self.progress_bar.set_description(f"Processing page {page_index + 1} of {pages_count}")
-                page_number = page_index + 1
-                suffix = f"-page-{page_number}"
-                image_path = temp_folder.joinpath(f"{self.path.stem}{suffix}.png")
-
-                try:
-                    pipeline_options: PdfPipelineOptions = PdfPipelineOptions()
-                    pipeline_options.do_ocr = True
-                    pipeline_options.do_table_structure = True
+                page_number: int = page_index + 1
 
-                    pipeline_options.do_formula_enrichment = self.do_formula_recognition
-                    pipeline_options.do_picture_description = self.do_image_description
-                    pipeline_options.artifacts_path = settings.cache_dir.joinpath("models")
+                rendered: Union[DocumentStream, Exception] = rendered_pages.get()
+                if isinstance(rendered, Exception):
+                    raise rendered
+                page_stream: DocumentStream = rendered
 
-                    if self.do_image_description:
-                        # Overwrite default 0.05 value for 5% of the page area
-                        pipeline_options.picture_description_options.picture_area_threshold = 0.0
+                self.progress_bar.update(rendering_step)
 
-                    converter: DocumentConverter = DocumentConverter(
-                        format_options={InputFormat.IMAGE: PdfFormatOption(pipeline_options=pipeline_options)}
-                    )
-                    result: ConversionResult = converter.convert(image_path)
+                try:
+                    result: ConversionResult = converter.convert(page_stream)
 
                     self.progress_bar.update(docling_step)
                 except Exception as e:
@@ -274,12 +261,6 @@ class DoclingWrapper:
 
                 internal_document.docling_version = document.version
 
-                # Save docling result as json to file
-                json_path: Path = outputs_folder.joinpath(f"{self.path.stem}{suffix}_output.json")
-
-                with open(json_path, "w") as f:
-                    json.dump(document.export_to_dict(), f, indent=4)
-
                 # Convert docling internal document into this project internal structure
                 page_item: PageItem = document.pages.popitem()[1]
                 internal_page: InternalPage = InternalPage()
@@ -288,12 +269,13 @@ class DoclingWrapper:
                 internal_page.width = page_item.size.width
                 internal_document.pages.append(internal_page)
 
+                items: dict[str, NodeItem] = self._create_item_index(document)
                 for reference in document.body.children:
-                    item: Optional[NodeItem] = self._get_item(document, reference.cref)
+                    item: Optional[NodeItem] = items.get(reference.cref)
                     if item is None:
                         continue
 
-                    elements: list[InternalElement] = self._create_elements(document, item, None)
+                    elements: list[InternalElement] = self._create_elements(items, item, None)
                     for element in elements:
                         # Adjust data to reflect that each page is run separately
                         self._set_page_to_element(element, page_number)
@@ -302,11 +284,105 @@ class DoclingWrapper:
                         internal_document.pages[page_index].ordered_elements.append(element)
 
                 self.progress_bar.update(convert_step)
+        finally:
+            # Stop rendering thread and unblock it if it waits for free space in queue
+            stop_rendering.set()
+            while render_thread.is_alive():
+                try:
+                    rendered_pages.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            render_thread.join()
+
+            with pypdfium2_lock:
+                pdf.close()
 
         return internal_document
 
+    def _render_pages(
+        self,
+        pdf: pdfium.PdfDocument,
+        rendered_pages: queue.Queue[Union[DocumentStream, Exception]],
+        stop_rendering: threading.Event,
+    ) -> None:
+        """
+        Renders PDF pages into in-memory images one by one and passes them through queue. Runs in separate thread
+        while Docling processes already rendered pages. Any exception is passed through queue instead of image.
+
+        Args:
+            pdf (pdfium.PdfDocument): Opened PDF document.
+            rendered_pages (queue.Queue[Union[DocumentStream, Exception]]): Queue to pass rendered images to.
+            stop_rendering (threading.Event): Set when rendered images are no longer needed.
+        """
+        try:
+            for page_index in range(len(pdf)):
+                if stop_rendering.is_set():
+                    return
+
+                page_number: int = page_index + 1
+                suffix: str = f"-page-{page_number}"
+                image_filename: str = f"{self.path.stem}{suffix}.png"
+
+                # Defensive only: Docling converts page images with ImageDocumentBackend and does not use pdfium
+                # here, but pdfium is not thread-safe, so keep any pdfium call serialized with Docling's lock
+                with pypdfium2_lock:
+                    page: pdfium.PdfPage = pdf.get_page(page_index)
+                    try:
+                        # Render directly in RGB byte order so PIL image is created without BGR to RGB conversion
+                        page_bitmap: pdfium.PdfBitmap = page.render(scale=ZOOM, rev_byteorder=True)
+                        page_image: Image.Image = page_bitmap.to_pil()
+                        # RGB PIL image has its own copy of pixels, so release native bitmap right away
+                        page_bitmap.close()
+                    finally:
+                        page.close()
+
+                # Keep image in memory instead of temporary file
+                # Image is only handed over to Docling, so skip compression (still lossless, no deflate/inflate)
+                image_stream: BytesIO = BytesIO()
+                page_image.save(image_stream, format="PNG", compress_level=0)
+                image_stream.seek(0)
+
+                rendered_pages.put(DocumentStream(name=image_filename, stream=image_stream))
+        except Exception as e:
+            rendered_pages.put(e)
+
+    def _create_pipeline_options(self) -> PdfPipelineOptions:
+        """
+        Creates Docling pipeline options according to requested processing.
+
+        Returns:
+            Pipeline options for Docling converter.
+        """
+        pipeline_options: PdfPipelineOptions = PdfPipelineOptions()
+        pipeline_options.do_ocr = True
+        pipeline_options.do_table_structure = True
+
+        pipeline_options.do_formula_enrichment = self.do_formula_recognition
+        pipeline_options.do_picture_description = self.do_image_description
+        pipeline_options.artifacts_path = settings.cache_dir.joinpath("models")
+
+        if self.do_image_description:
+            # Overwrite default 0.05 value for 5% of the page area
+            pipeline_options.picture_description_options.picture_area_threshold = 0.0
+
+        return pipeline_options
+
+    def _create_converter(self, input_format: InputFormat) -> DocumentConverter:
+        """
+        Creates Docling converter for provided input format. Converter keeps its initialized pipeline (with loaded
+        models) so it should be created once and reused for all conversions.
+
+        Args:
+            input_format (InputFormat): Format of the documents that converter processes.
+
+        Returns:
+            Docling converter.
+        """
+        pipeline_options: PdfPipelineOptions = self._create_pipeline_options()
+        return DocumentConverter(format_options={input_format: PdfFormatOption(pipeline_options=pipeline_options)})
+
     def _create_elements(
-        self, document: DoclingDocument, item: NodeItem, parent: Optional[InternalElement]
+        self, items: dict[str, NodeItem], item: NodeItem, parent: Optional[InternalElement]
     ) -> list[InternalElement]:
         """
         Creates element(s) from provided document and item. Some NodeItem can result in many elements.
@@ -314,7 +390,7 @@ class DoclingWrapper:
         Creates also children recursively.
 
         Args:
-            document (DoclingDocument): Processed document by Docling.
+            items (dict[str, NodeItem]): All NodeItems of processed document indexed by their Docling identifier.
             item (NodeItem): Structure element that is processed according to its data.
             parent (Optional[InternalElement]): Already created parent or None.
 
@@ -350,7 +426,7 @@ class DoclingWrapper:
         if len(item.children) > 0:
             # Convert children
             for child_ref in item.children:
-                child_item: Optional[NodeItem] = self._get_item(document, child_ref.cref)
+                child_item: Optional[NodeItem] = items.get(child_ref.cref)
                 if child_item is None:
                     continue
                 # More children are expected for GroupItem -> there will be just one internal_element
@@ -358,7 +434,7 @@ class DoclingWrapper:
                 # the same page
                 # With this we can safely assume that internal_element (always first create element for NodeItem)
                 # is parent for their page
-                child_elements: list[InternalElement] = self._create_elements(document, child_item, internal_element)
+                child_elements: list[InternalElement] = self._create_elements(items, child_item, internal_element)
                 children.extend(child_elements)
 
             # Sort children into page numbers
@@ -387,36 +463,30 @@ class DoclingWrapper:
 
         return internal_elements
 
-    def _get_item(self, document: DoclingDocument, reference: str) -> Optional[NodeItem]:
+    def _create_item_index(self, document: DoclingDocument) -> dict[str, NodeItem]:
         """
-        Retrieves NodeItem from DoclingDocument according to its Docling indentificator.
+        Indexes all NodeItems of DoclingDocument according to their Docling indentificator.
 
         Args:
             document (DoclingDocument): Processed document by Docling.
-            reference (str): Docling type of unique identifier.
 
         Returns:
-            Found NodeItem or None.
+            Dictionary from Docling type of unique identifier to NodeItem.
         """
-        for group in document.groups:
-            if group.self_ref == reference:
-                return group
-        for text in document.texts:
-            if text.self_ref == reference:
-                return text
-        for picture in document.pictures:
-            if picture.self_ref == reference:
-                return picture
-        for table in document.tables:
-            if table.self_ref == reference:
-                return table
-        for key_value_item in document.key_value_items:
-            if key_value_item.self_ref == reference:
-                return key_value_item
-        for form_item in document.form_items:
-            if form_item.self_ref == reference:
-                return form_item
-        return None
+        items: dict[str, NodeItem] = {}
+        collections: list[list] = [
+            document.groups,
+            document.texts,
+            document.pictures,
+            document.tables,
+            document.key_value_items,
+            document.form_items,
+        ]
+        for collection in collections:
+            for node_item in collection:
+                # Keep first found item as searching through collections did
+                items.setdefault(node_item.self_ref, node_item)
+        return items
 
     def _set_page_to_element(self, element: InternalElement, page_number: int) -> None:
         """
@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from typing import Optional
 
+import orjson
 from pdfixsdk import (
     GetPdfix,
     PdfDoc,
@@ -111,8 +111,12 @@ class AutotagUsingDoclingLayoutRecognition:
             id: str = Path(self.input_path_str).stem
             template_path: Path = output_directory.joinpath(f"{id}-template_json.json")
 
-            with open(template_path, "w") as file:
-                file.write(json.dumps(template_json_dict, indent=2))
+            # Serialize template only once and use the same data for file and for PDFix SDK
+            # orjson produces compact UTF-8 bytes directly
+            template_json_data: bytes = orjson.dumps(template_json_dict)
+
+            with open(template_path, "wb") as file:
+                file.write(template_json_data)
 
             progress_bar.n = PROGRESS_FIRST_STEP + PROGRESS_SECOND_STEP + PROGRESS_THIRD_STEP
             progress_bar.set_description("Autotagging")
@@ -132,7 +136,7 @@ class AutotagUsingDoclingLayoutRecognition:
                 raise PdfixFailedToOpenException(pdfix, self.input_path_str)
 
             # Autotag document
-            self._autotag_using_template(doc, template_json_dict, pdfix)
+            self._autotag_using_template(doc, template_json_data, pdfix)
 
             # Save the processed document
             if not doc.Save(self.output_path_str, kSaveFull):
@@ -142,13 +146,13 @@ class AutotagUsingDoclingLayoutRecognition:
             progress_bar.set_description("Done")
             progress_bar.refresh()
 
-    def _autotag_using_template(self, doc: PdfDoc, template_json_dict: dict, pdfix: Pdfix) -> None:
+    def _autotag_using_template(self, doc: PdfDoc, template_json_data: bytes, pdfix: Pdfix) -> None:
         """
         Autotag opened document using template and remove previous tags and structures.
 
         Args:
             doc (PdfDoc): Opened document to tag.
-            template_json_dict (dict): Template for tagging.
+            template_json_data (bytes): Serialized template for tagging.
             pdfix (Pdfix): Pdfix SDK.
         """
         # Remove old structure and prepare an empty structure tree
@@ -163,7 +167,7 @@ class AutotagUsingDoclingLayoutRecognition:
             raise PdfixFailedToTagException(pdfix, "Failed to create memory stream")
 
         try:
-            raw_data, raw_data_size = json_to_raw_data(template_json_dict)
+            raw_data, raw_data_size = json_to_raw_data(template_json_data)
             if not memory_stream.Write(0, raw_data, raw_data_size):
                 raise PdfixFailedToTagException(pdfix, "Failed to write template data into memory")
 
@@ -172,8 +176,6 @@ class AutotagUsingDoclingLayoutRecognition:
                 raise PdfixFailedToTagException(pdfix, "Failed to get document template")
             if not doc_template.LoadFromStream(memory_stream, kDataFormatJson):
                 raise PdfixFailedToTagException(pdfix, "Failed to save template into document")
-        except Exception:
-            raise
         finally:
             memory_stream.Destroy()
 
@@ -2,13 +2,13 @@ import json
 import logging
 import os
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Optional
 
 import requests
 
-from constants import CONFIG_FILE, DOCKER_IMAGE, DOCKER_NAMESPACE, DOCKER_REPOSITORY
+from constants import DOCKER_IMAGE, DOCKER_NAMESPACE, DOCKER_REPOSITORY
 from logger import get_logger
+from utils import get_current_version
 
 logger: logging.Logger = get_logger()
 
@@ -28,7 +28,7 @@ class DockerImageContainerUpdateChecker:
         """
         try:
             if not self._last_check_today():
-                current_version: str = self._get_current_version()
+                current_version: str = get_current_version()
                 latest_version: Optional[str] = self._get_latest_docker_version()
 
                 if latest_version and latest_version != current_version:
@@ -42,22 +42,6 @@ class DockerImageContainerUpdateChecker:
             # do not propagate any exceptions up
             pass
 
-    def _get_current_version(self) -> str:
-        """
-        Read the current version from config.json.
-
-        Returns:
-            The current version of the Docker image.
-        """
-        config_path: Path = Path(__file__).parent.joinpath(f"../{CONFIG_FILE}").resolve()
-        try:
-            with open(config_path, "r", encoding="utf-8") as file:
-                config: Any = json.load(file)
-                return config.get("version", "unknown")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            logger.error(f"Error reading {CONFIG_FILE}: {e}")
-            return "unknown"
-
     def _get_latest_docker_version(self) -> Optional[str]:
         """
         Fetch the latest available version from Docker Hub.
@@ -15,6 +15,9 @@ class InternalElement:
     Contains also information if this is continuous structure and has reference to first structure.
     """
 
+    # Created for every Docling item, so keep instances small
+    __slots__ = ("item", "provenance_index", "children", "page_number", "parent", "continuous_element")
+
     def __init__(self, item: NodeItem, parent: Optional["InternalElement"]) -> None:
         """
         Constructor.
@@ -63,6 +66,8 @@ class InternalPage:
     Class to represent one page of PDF document with list of elements that are in order Docling provided.
     """
 
+    __slots__ = ("number", "height", "width", "ordered_elements")
+
     def __init__(self) -> None:
         """
         Constructor.
@@ -78,6 +83,8 @@ class InternalDocument:
     Class to represent whole PDF document with list of pages and used Docling version.
     """
 
+    __slots__ = ("pages", "docling_version")
+
     def __init__(self) -> None:
         """
         Constructor.
@@ -69,13 +69,8 @@ def render_page(pdfix: Pdfix, pdf_page: PdfPage, page_view: PdfPageView, temp_fi
             # Save the image to the file stream
             if not page_image.SaveToStream(file_stream, image_params):
                 raise PdfixFailedToRenderException(pdfix, "Failed to save rendered image to temporary file")
-
-        except Exception:
-            raise
         finally:
             file_stream.Destroy()
-    except Exception:
-        raise
     finally:
         page_image.Destroy()
 
@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Optional, Union
 
 from docling_core.types.doc import (
-    BoundingBox,
     CodeItem,
     DescriptionAnnotation,
     DocItem,
@@ -72,6 +71,35 @@ class TemplateJsonCreator:
             "initial_element_overlap": "0.6",
         }
     ]
+    # Tags and flags for TextItem labels, labels not listed here get neither
+    TEXT_LABEL_TAGS: dict[DocItemLabel, str] = {
+        DocItemLabel.CAPTION: "Caption",
+        DocItemLabel.FOOTNOTE: "Note",
+        DocItemLabel.REFERENCE: "Reference",
+    }
+    TEXT_LABEL_FLAGS: dict[DocItemLabel, tuple[str, ...]] = {
+        DocItemLabel.PAGE_FOOTER: ("footer", "artifact"),
+        DocItemLabel.PAGE_HEADER: ("header", "artifact"),
+    }
+    # Tags for GroupItem labels, others are tagged as NonStruct
+    GROUP_LABEL_TAGS: dict[GroupLabel, str] = {
+        GroupLabel.CHAPTER: "Sect",
+        GroupLabel.SECTION: "Part",
+    }
+    # Numbering detection for list item markers
+    DECIMAL_MARKER: re.Pattern = re.compile(r"\d+")
+    UPPER_ROMAN_MARKER: re.Pattern = re.compile(r"M{0,4}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})")
+    LOWER_ROMAN_MARKER: re.Pattern = re.compile(r"m{0,4}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})")
+    UPPER_ALPHA_MARKER: re.Pattern = re.compile(r"[A-Z]")
+    LOWER_ALPHA_MARKER: re.Pattern = re.compile(r"[a-z]")
+    DISC_MARKERS: frozenset[str] = frozenset(["•", "●", "◉", "◌", "◍", "◎", "○", "·", "˚", "°", "∙"])
+    SQUARE_MARKERS: frozenset[str] = frozenset(["▪", "▫", "■", "□", "▣", "▤", "▥", "▦", "▧", "▨", "▩"])
+    ARROW_MARKERS: frozenset[str] = frozenset(
+        ["→", "⇒", "➔", "➙", "➛", "➜", "➝", "➞", "➟", "➠", "➡", "►", "▶", "▸", "‣", "➤", "➢"]
+    )
+    CHECK_MARKERS: frozenset[str] = frozenset(["✓", "✔", "✗", "✘", "☑", "☒", "☓"])
+    REST_MARKERS: frozenset[str] = frozenset(["-", "*", "+", "⁃", "−", "–"])
+    UNORDERED_MARKERS: frozenset[str] = ARROW_MARKERS | CHECK_MARKERS | REST_MARKERS
 
     def __init__(self, input_path_str: str, bbox_overlap: float, progress_bar: tqdm, total_progress_units: int) -> None:
         """
@@ -140,12 +168,8 @@ class TemplateJsonCreator:
                         page_dict: dict = self.process_page(page, page_view)
                         self.template_json_pages.append(page_dict)
                         self.progress_bar.update(step)
-                    except Exception:
-                        raise
                     finally:
                         page_view.Release()
-                except Exception:
-                    raise
                 finally:
                     pdf_page.Release()
 
@@ -228,9 +252,10 @@ class TemplateJsonCreator:
         flag_list: list[str] = []
         if element.continuous_element is not None:
             flag_list.append("continuous")
-        bbox_list: Optional[list[str]] = self._get_template_bbox(element, page_view, page_height)
-        if bbox_list is not None:
-            result["bbox"] = bbox_list
+        # Converted once and reused also for table cells
+        pdf_rect: Optional[PdfRect] = self._get_pdfrect(element, page_view, page_height)
+        if pdf_rect is not None:
+            result["bbox"] = self._convert_pdfrect_to_list_str(pdf_rect)
         label: str = self._get_label(element)
         # layer: str = self._get_content_layer(element)
         result["comment"] = f"{element_ref} {label}"
@@ -283,9 +308,6 @@ class TemplateJsonCreator:
                 },
             }
 
-            # if bbox_list is None:
-            #     result["bbox"] = self._calculate_bbox_from_children(element.children, page_view, page_height)
-
         if isinstance(item, TextItem):
             hyperlink: Optional[Union[AnyUrl, Path]] = item.hyperlink
             if isinstance(hyperlink, AnyUrl):
@@ -342,29 +364,10 @@ class TemplateJsonCreator:
                 result["mathml"] = convert_to_base64(convert_latex_to_mathml(latex_formula))
             result["type"] = "pde_image"
         elif isinstance(item, TextItem):
-            match item.label:
-                case DocItemLabel.CAPTION:
-                    result["tag"] = "Caption"
-                case DocItemLabel.CHECKBOX_SELECTED:
-                    pass
-                case DocItemLabel.CHECKBOX_UNSELECTED:
-                    pass
-                case DocItemLabel.FOOTNOTE:
-                    result["tag"] = "Note"
-                case DocItemLabel.PAGE_FOOTER:
-                    flag_list.append("footer")
-                    flag_list.append("artifact")
-                case DocItemLabel.PAGE_HEADER:
-                    flag_list.append("header")
-                    flag_list.append("artifact")
-                case DocItemLabel.PARAGRAPH:
-                    pass
-                case DocItemLabel.REFERENCE:
-                    result["tag"] = "Reference"
-                case DocItemLabel.TEXT:
-                    pass
-                case DocItemLabel.EMPTY_VALUE:
-                    pass
+            text_tag: Optional[str] = self.TEXT_LABEL_TAGS.get(item.label)
+            if text_tag is not None:
+                result["tag"] = text_tag
+            flag_list.extend(self.TEXT_LABEL_FLAGS.get(item.label, ()))
             # result["text_flag"] = "no_new_line"
             result["type"] = "pde_text"
         elif isinstance(item, PictureItem):
@@ -384,8 +387,9 @@ class TemplateJsonCreator:
             result["type"] = "pde_image"
         elif isinstance(item, TableItem):
             table_data: TableData = item.data
-            # We already know this value but for processing table we need to extract it as integers:
-            table_pdfrect: PdfRect = self._get_table_pdfrect(element, page_view, page_height)
+            table_pdfrect: PdfRect = pdf_rect if pdf_rect is not None else PdfRect()
+            if pdf_rect is None:
+                logger.error("We should never get here as table element should have bounding box from Docling.")
             cells: list = self._create_cells(table_pdfrect, table_data, page_view, page_height, element_ref)
             if "element_template" not in result:
                 result["element_template"] = {
@@ -417,13 +421,7 @@ class TemplateJsonCreator:
             # Default - should not get here
             result["type"] = "pde_container"
         elif isinstance(item, GroupItem):
-            match item.label:
-                case GroupLabel.CHAPTER:
-                    result["tag"] = "Sect"
-                case GroupLabel.SECTION:
-                    result["tag"] = "Part"
-                case _:
-                    result["tag"] = "NonStruct"
+            result["tag"] = self.GROUP_LABEL_TAGS.get(item.label, "NonStruct")
             result["type"] = "pde_container"
         elif isinstance(item, FloatingItem):
             # Default - should not get here
@@ -441,11 +439,9 @@ class TemplateJsonCreator:
 
         return results
 
-    def _get_template_bbox(
-        self, element: InternalElement, page_view: PdfPageView, page_height: float
-    ) -> Optional[list[str]]:
+    def _get_pdfrect(self, element: InternalElement, page_view: PdfPageView, page_height: float) -> Optional[PdfRect]:
         """
-        Get bounding box for json as pdfix template expects.
+        Get bounding box for element in PdfRect as PDFix SDK uses.
 
         Args:
             element (InternalElement): Element to get bbox for.
@@ -453,13 +449,12 @@ class TemplateJsonCreator:
             page_height (float): Height of the page to convert bbox.
 
         Returns:
-            List of strings representing bbox for json or None if not applicable.
+            Bounding box in PdfRect as PDFix SDK uses or None if not applicable.
         """
         item: NodeItem = element.item
         if isinstance(item, DocItem):
             provenance: ProvenanceItem = item.prov[element.provenance_index]
-            pdf_rect: PdfRect = convert_bbox_to_pdfrect(provenance.bbox, page_view, page_height)
-            return self._convert_pdfrect_to_list_str(pdf_rect)
+            return convert_bbox_to_pdfrect(provenance.bbox, page_view, page_height)
 
         return None
 
@@ -473,7 +468,7 @@ class TemplateJsonCreator:
         Returns:
             List of strings representing bbox for json.
         """
-        return [str(pdf_rect.left), str(pdf_rect.bottom), str(pdf_rect.right), str(pdf_rect.top)]
+        return [f"{pdf_rect.left}", f"{pdf_rect.bottom}", f"{pdf_rect.right}", f"{pdf_rect.top}"]
 
     def _get_label(self, element: InternalElement) -> str:
         """
@@ -492,26 +487,6 @@ class TemplateJsonCreator:
             return str(item.label)
         return ""
 
-    def _get_table_pdfrect(self, table_element: InternalElement, page_view: PdfPageView, page_height: float) -> PdfRect:
-        """
-        Get bounding box for table in PdfRect as PDFix SDK uses.
-
-        Args:
-            table_element (InternalElement): Table element to get bbox for.
-            page_view (PdfPageView): PDFix SDK page view to get page dimensions for bbox conversion.
-            page_height (float): Height of the page to convert bbox.
-
-        Returns:
-            Bounding box for table in PdfRect as PDFix SDK uses.
-        """
-        item: NodeItem = table_element.item
-        if isinstance(item, DocItem):
-            provenance: ProvenanceItem = item.prov[table_element.provenance_index]
-            return convert_bbox_to_pdfrect(provenance.bbox, page_view, page_height)
-
-        logger.error("We should never get here as table element should have bounding box from Docling.")
-        return PdfRect()
-
     def _create_cells(
         self, table_pdfrect: PdfRect, table: TableData, page_view: PdfPageView, page_height: float, table_ref: str
     ) -> list:
@@ -546,10 +521,10 @@ class TemplateJsonCreator:
                 # cell_id: str = f"{table_ref}-cell-{cell_row}-{cell_column}"
                 cell_scope: str = self._get_cell_scope(cell)
                 cell_dict: dict = {
-                    "cell_column": str(cell_column),
-                    "cell_column_span": str(cell.col_span),
-                    "cell_row": str(cell_row),
-                    "cell_row_span": str(cell.row_span),
+                    "cell_column": f"{cell_column}",
+                    "cell_column_span": f"{cell.col_span}",
+                    "cell_row": f"{cell_row}",
+                    "cell_row_span": f"{cell.row_span}",
                     "comment": f"Cell Pos: [{cell_row}, {cell_column}]",
                     # "name": cell_id,
                     # "parent": table_ref,
@@ -608,7 +583,7 @@ class TemplateJsonCreator:
         Get list type value for json as pdfix template expects.
 
         Args:
-            group (GroupItem): Group to get list type for.
+            item (ListItem): List item to get list type for.
 
         Returns:
             List type as string for json purposes.
@@ -616,78 +591,30 @@ class TemplateJsonCreator:
         marker: str = item.marker.strip()
         stripped_marker: str = marker.lstrip("([").rstrip(")].:")
         if item.enumerated:
-            if re.fullmatch(r"\d+", stripped_marker):
+            if self.DECIMAL_MARKER.fullmatch(stripped_marker):
                 return "Decimal"
             # Docling for upper roman uses only "[IVXLCDM]+\." for original (not stripped) marker
-            if re.fullmatch(r"M{0,4}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})", stripped_marker):
+            if self.UPPER_ROMAN_MARKER.fullmatch(stripped_marker):
                 return "UpperRoman"
             # Docling for lower roman uses only "[ivxlcdm]+\." for original (not stripped) marker
-            if re.fullmatch(r"m{0,4}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})", stripped_marker):
+            if self.LOWER_ROMAN_MARKER.fullmatch(stripped_marker):
                 return "LowerRoman"
-            if re.fullmatch(r"[A-Z]", stripped_marker):
+            if self.UPPER_ALPHA_MARKER.fullmatch(stripped_marker):
                 return "UpperAlpha"
-            if re.fullmatch(r"[a-z]", stripped_marker):
+            if self.LOWER_ALPHA_MARKER.fullmatch(stripped_marker):
                 return "LowerAlpha"
             if len(marker) > 1:
                 return "Description"
             return "Ordered"
         else:
-            disc_markers: list[str] = ["•", "●", "◉", "◌", "◍", "◎", "○", "·", "˚", "°", "∙"]
-            square_markers: list[str] = ["▪", "▫", "■", "□", "▣", "▤", "▥", "▦", "▧", "▨", "▩"]
-            arrows: list[str] = ["→", "⇒", "➔", "➙", "➛", "➜", "➝", "➞", "➟", "➠", "➡", "►", "▶", "▸", "‣", "➤", "➢"]
-            check_markers: list[str] = ["✓", "✔", "✗", "✘", "☑", "☒", "☓"]
-            rest: list[str] = ["-", "*", "+", "⁃", "−", "–"]
-
             if marker == "":
                 return "None"
-            if marker in disc_markers:
+            if marker in self.DISC_MARKERS:
                 return "Disc"
-            if marker in square_markers:
+            if marker in self.SQUARE_MARKERS:
                 return "Square"
             if len(marker) > 1:
                 return "Description"
-            if marker in arrows or marker in check_markers or marker in rest:
+            if marker in self.UNORDERED_MARKERS:
                 return "Unordered"
         return "None"
-
-    def _calculate_bbox_from_children(
-        self, children: list[InternalElement], page_view: PdfPageView, page_height: float
-    ) -> list[str]:
-        """
-        Calculate bounding box that covers all children elements.
-
-        Args:
-            children (list[InternalElement]): List of child elements to calculate bbox for.
-            page_view (PdfPageView): PDFix SDK page view to get page dimensions for bbox conversion.
-            page_height (float): Height of the page to convert bbox.
-
-        Returns:
-            Bbox covering all children as list of strings for json purposes.
-        """
-        if len(children) == 0:
-            return ["0", "0", "0", "0"]
-
-        result: Optional[PdfRect] = None
-
-        for child in children:
-            if isinstance(child.item, DocItem) and len(child.item.prov) > 0:
-                provenance: ProvenanceItem = child.item.prov[0]
-                bbox: BoundingBox = provenance.bbox
-                pdf_rect: PdfRect = convert_bbox_to_pdfrect(bbox, page_view, page_height)
-
-                if result is None:
-                    result = pdf_rect
-                else:
-                    if pdf_rect.left < result.left:
-                        result.left = pdf_rect.left
-                    if pdf_rect.bottom < result.bottom:
-                        result.bottom = pdf_rect.bottom
-                    if pdf_rect.right > result.right:
-                        result.right = pdf_rect.right
-                    if pdf_rect.top > result.top:
-                        result.top = pdf_rect.top
-
-        if result is None:
-            return ["0", "0", "0", "0"]
-
-        return self._convert_pdfrect_to_list_str(result)
@@ -1,4 +1,5 @@
 import base64
+import functools
 import json
 import logging
 from pathlib import Path
@@ -14,6 +15,8 @@ from logger import get_logger
 
 logger: logging.Logger = get_logger()
 
+CONFIG_PATH: Path = Path(__file__).parent.joinpath(f"../{CONFIG_FILE}").resolve()
+
 
 def convert_latex_to_mathml(latex_formula: str) -> str:
     """
@@ -71,16 +74,16 @@ def disable_additional_logging() -> None:
     logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
 
 
+@functools.cache
 def get_current_version() -> str:
     """
-    Read the current version from config.json.
+    Read the current version from config.json. File is read only once, later calls return cached value.
 
     Returns:
         The current version of the Docker image.
     """
-    config_path: Path = Path(__file__).parent.joinpath(f"../{CONFIG_FILE}").resolve()
     try:
-        with open(config_path, "r", encoding="utf-8") as file:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as file:
             config: Any = json.load(file)
             return config.get("version", "unknown")
     except (FileNotFoundError, json.JSONDecodeError) as e:
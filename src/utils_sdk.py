@@ -1,5 +1,4 @@
 import ctypes
-import json
 import logging
 from typing import Optional
 
@@ -43,37 +42,40 @@ def convert_bbox_to_pdfrect(bbox: BoundingBox, page_view: PdfPageView, page_heig
     Args:
         bbox (BoundingBox): Bounding box to convert.
         page_view (PdfPageView): PDFix SDK page view to get page dimensions for bbox conversion.
+        page_height (float): Height of the page to convert bbox.
 
     Returns:
         PDFix SDK PdfRect.
     """
+    top: float = bbox.t
+    bottom: float = bbox.b
     if bbox.coord_origin == CoordOrigin.BOTTOMLEFT:
-        # Convert to top left origin for PDFix SDK
-        bbox = bbox.to_top_left_origin(page_height)
+        # Convert to top left origin for PDFix SDK without creating intermediate BoundingBox
+        top = page_height - bbox.t
+        bottom = page_height - bbox.b
 
     rectangle: PdfDevRect = PdfDevRect()
     rectangle.left = round(bbox.l)
-    rectangle.top = round(bbox.t)
+    rectangle.top = round(top)
     rectangle.right = round(bbox.r)
-    rectangle.bottom = round(bbox.b)
+    rectangle.bottom = round(bottom)
 
     return page_view.RectToPage(rectangle)
 
 
-def json_to_raw_data(json_dict: dict) -> tuple[ctypes.Array[ctypes.c_ubyte], int]:
+def json_to_raw_data(json_data: bytes) -> tuple[ctypes.Array[ctypes.c_ubyte], int]:
     """
-    Converts a JSON dictionary into a raw byte array (c_ubyte array) that can be used for low-level data operations.
+    Converts serialized JSON into a raw byte array (c_ubyte array) that can be used for low-level data operations.
 
     Parameters:
-        json_dict (dict): A Python dictionary to be converted into JSON format and then into raw bytes.
+        json_data (bytes): UTF-8 encoded JSON data.
 
     Returns:
         tuple: A tuple containing:
             - json_data_raw (ctypes.c_ubyte array): The raw byte array representation of the JSON data.
             - json_data_size (int): The size of the JSON data in bytes.
     """
-    json_str: str = json.dumps(json_dict)
-    json_data: bytearray = bytearray(json_str.encode("utf-8"))
-    json_data_size: int = len(json_str)
-    json_data_raw: ctypes.Array[ctypes.c_ubyte] = (ctypes.c_ubyte * json_data_size).from_buffer(json_data)
+    json_data_size: int = len(json_data)
+    # Copy directly from immutable bytes without intermediate bytearray
+    json_data_raw: ctypes.Array[ctypes.c_ubyte] = (ctypes.c_ubyte * json_data_size).from_buffer_copy(json_data)
     return json_data_raw, json_data_size